@@ -4,14 +4,51 @@ Simple inventory module with safe I/O, validation, and PEP 8 compliance.
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import BinaryIO, Callable, Dict, Iterable, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+__all__ = [
+    "Inventory",
+    "LogRecord",
+    "add_item",
+    "add_items_bulk",
+    "check_low_items",
+    "demo",
+    "flush_logs",
+    "format_log",
+    "get_qty",
+    "load_data",
+    "make_adder",
+    "print_data",
+    "remove_item",
+    "save_batch",
+    "save_data",
+    "stock_data",
+]
 
 # In-memory stock storage
 stock_data: Dict[str, int] = {}
 
+# Buffered add_item log record: (time_ns, item, qty); see format_log
+LogRecord = Tuple[int, str, int]
+
+# Files written by Inventory.save_data: resolved path -> signature
+_saved_files: Dict[Path, Tuple[int, int, int]] = {}
+
+# Exact types accepted by the fast validation path in the mutators
+_STR, _INT = str, int
+
 
 def _validate_item(item: str) -> None:
     """Validate item name is a non-empty string."""
@@ -33,91 +70,333 @@ def _validate_qty_to_remove(qty: int) -> None:
         raise ValueError("qty must be a positive integer")
 
 
-def add_item(item: str = "default", qty: int = 0, logs: List[str] | None = None) -> None:
-    """
-    Add qty units of item to inventory.
-    Uses a non-mutable default for logs to avoid shared state.
-    """
-    if logs is None:
-        logs = []
-    _validate_item(item)
-    _validate_qty_to_add(qty)
-    stock_data[item] = stock_data.get(item, 0) + qty
-    logs.append(f"{datetime.now()}: Added {qty} of {item}")
+def _validate_threshold(threshold: int) -> None:
+    """Validate threshold for check_low_items is a non-negative integer."""
+    if not isinstance(threshold, int) or threshold < 0:
+        raise ValueError("threshold must be a non-negative integer")
 
 
-def remove_item(item: str, qty: int) -> None:
-    """
-    Remove qty units of item.
-    If resulting quantity <= 0 or item is absent, item is removed.
-    """
-    _validate_item(item)
-    _validate_qty_to_remove(qty)
-    current = stock_data.get(item)
-    if current is None:
-        # Nothing to remove; no exception masking
-        return
-    remaining = current - qty
-    if remaining > 0:
-        stock_data[item] = remaining
-    else:
-        del stock_data[item]
+def _intern(item: str) -> str:
+    """Intern exact str keys so later lookups can match by identity."""
+    return sys.intern(item) if type(item) is _STR else item
 
 
-def get_qty(item: str) -> int:
+def _signature(st: os.stat_result) -> Tuple[int, int, int]:
+    """Return the (inode, mtime_ns, size) triple identifying a file version."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _valid_quantities(data: Dict[str, object]) -> bool:
+    """Return True if every value in parsed JSON data is an integer."""
+    return all(isinstance(v, int) for v in data.values())
+
+
+def _dump(data: Dict[str, int], f: BinaryIO) -> bool:
     """
-    Return quantity for item; returns 0 if item not present.
+    Write data to binary file f as compact UTF-8 JSON.
+    Return True if _loads reads the file back exactly without validation.
     """
-    _validate_item(item)
-    return stock_data.get(item, 0)
+    if orjson is not None:
+        try:
+            # OPT_NON_STR_KEYS accepts str subclasses such as StrEnum keys
+            encoded = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them,
+            # but orjson would read them back as floats
+            pass
+        else:
+            f.write(encoded)
+            return True
+    # One-shot dumps uses the C encoder; streaming json.dump would save
+    # memory but runs the pure-Python encoder, which is several times slower
+    f.write(
+        json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+    )
+    return orjson is None
+
+
+def _loads(raw: bytes) -> object:
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
-def load_data(file: str = "inventory.json") -> None:
+def _tmp_path(path: Path) -> Path:
+    """Return the temp file name used while saving path."""
+    return path.with_suffix(path.suffix + ".tmp")
+
+
+def _write_tmp(path: Path, data: Dict[str, int]) -> Tuple[Path, bool]:
     """
-    Load inventory from JSON file with encoding and schema validation.
+    Write data to a temp file beside path and fsync it.
+    Return the temp path and whether it loads back exactly (see _dump).
     """
-    path = Path(file)
-    if not path.exists():
+    tmp = _tmp_path(path)
+    try:
+        with tmp.open("wb") as f:
+            exact = _dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return tmp, exact
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist renames in directory; a no-op where dirs cannot be opened."""
+    if os.name != "posix":
         return
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    if not isinstance(data, dict) or not all(
-        isinstance(k, str) and isinstance(v, int) for k, v in data.items()
-    ):
-        raise ValueError("inventory file schema invalid")
-    stock_data.clear()
-    stock_data.update(data)
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
-def save_data(file: str = "inventory.json") -> None:
+class Inventory:
     """
-    Save inventory to JSON file atomically with UTF-8 encoding.
+    Stock levels keyed by item name, backed by a plain dict.
+    Methods bind the dict to a local so hot paths avoid global lookups.
     """
-    path = Path(file)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(stock_data, f, ensure_ascii=False, separators=(",", ":"))
-    tmp.replace(path)
 
+    __slots__ = ("_data",)
 
-def print_data() -> None:
-    """Print a human-readable report of all items."""
-    print("Items Report")
-    for name, qty in stock_data.items():
-        print(f"{name} -> {qty}")
+    def __init__(self, data: Dict[str, int] | None = None) -> None:
+        self._data: Dict[str, int] = {} if data is None else data
 
+    def add_item(
+        self,
+        item: str = "default",
+        qty: int = 0,
+        logs: List[LogRecord] | None = None,
+    ) -> None:
+        """
+        Add qty units of item to inventory.
+        If logs is given, an unformatted record is appended; see flush_logs.
+        """
+        # Fast path: exact-type checks; the helpers handle subclasses/errors
+        if type(item) is not _STR or not item or item.isspace():
+            _validate_item(item)
+        if type(qty) is not _INT or qty < 0:
+            _validate_qty_to_add(qty)
+        data = self._data
+        current = data.get(item)
+        if current is None:
+            # New key: store an interned copy, existing keys are kept as-is
+            data[_intern(item)] = qty
+        else:
+            data[item] = current + qty
+        if logs is not None:
+            logs.append((time.time_ns(), item, qty))
 
-def check_low_items(threshold: int = 5) -> List[str]:
+    def add_items_bulk(
+        self,
+        items: Iterable[Tuple[str, int]],
+        logs: List[LogRecord] | None = None,
+    ) -> None:
+        """
+        Add many (item, qty) pairs in one call.
+        Lookups are bound once; pairs before an invalid one remain applied.
+        """
+        data = self._data
+        get = data.get
+        log = None if logs is None else logs.append
+        for item, qty in items:
+            if type(item) is not _STR or not item or item.isspace():
+                _validate_item(item)
+            if type(qty) is not _INT or qty < 0:
+                _validate_qty_to_add(qty)
+            current = get(item)
+            if current is None:
+                data[_intern(item)] = qty
+            else:
+                data[item] = current + qty
+            if log is not None:
+                log((time.time_ns(), item, qty))
+
+    def make_adder(self, item: str) -> Callable[[int], None]:
+        """
+        Return a function that adds qty units of one pre-validated item.
+        The item is checked and interned once; the adder does not log.
+        """
+        if type(item) is not _STR or not item or item.isspace():
+            _validate_item(item)
+        key = _intern(item)
+        data = self._data
+
+        def add(qty: int) -> None:
+            if type(qty) is not _INT or qty < 0:
+                _validate_qty_to_add(qty)
+            data[key] = data.get(key, 0) + qty
+
+        return add
+
+    def remove_item(self, item: str, qty: int) -> None:
+        """
+        Remove qty units of item.
+        If resulting quantity <= 0 or item is absent, item is removed.
+        """
+        if type(item) is not _STR or not item or item.isspace():
+            _validate_item(item)
+        if type(qty) is not _INT or qty <= 0:
+            _validate_qty_to_remove(qty)
+        data = self._data
+        # get + set rather than pop + reinsert: reinserting would move the
+        # item to the end and reorder print_data/save_data output
+        current = data.get(item)
+        if current is None:
+            # Nothing to remove; no exception masking
+            return
+        remaining = current - qty
+        if remaining > 0:
+            data[item] = remaining
+        else:
+            del data[item]
+
+    def get_qty(self, item: str) -> int:
+        """
+        Return quantity for item; returns 0 if item not present.
+        """
+        if type(item) is not _STR or not item or item.isspace():
+            _validate_item(item)
+        return self._data.get(item, 0)
+
+    def check_low_items(self, threshold: int = 5) -> List[str]:
+        """
+        Return list of item names whose quantities are below threshold.
+        """
+        if type(threshold) is not _INT or threshold < 0:
+            _validate_threshold(threshold)
+        return [name for name, qty in self._data.items() if qty < threshold]
+
+    def load_data(
+        self, file: str = "inventory.json", validate: bool = True
+    ) -> None:
+        """
+        Load inventory from JSON file with encoding and schema validation.
+        Pass validate=False only for trusted files to skip per-entry checks;
+        values are then used as parsed. Files this process saved with
+        save_data and that are unchanged since are trusted automatically.
+        """
+        path = Path(file)
+        if not path.exists():
+            return
+        with path.open("rb") as f:
+            st = os.fstat(f.fileno())
+            raw = f.read()
+        if validate and _saved_files.get(path.resolve()) == _signature(st):
+            validate = False
+        data = _loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("inventory file schema invalid")
+        # JSON object keys are always str, so only values need checking;
+        # validating before clearing keeps the inventory intact on errors
+        if validate and not _valid_quantities(data):
+            if orjson is None:
+                raise ValueError("inventory file schema invalid")
+            # orjson reads integers beyond 64 bits as floats; the stdlib
+            # parser keeps them, so retry with it before rejecting the file
+            data = json.loads(raw)
+            if not _valid_quantities(data):
+                raise ValueError("inventory file schema invalid")
+        self._data.clear()
+        self._data.update(data)
+
+    def save_data(self, file: str = "inventory.json") -> None:
+        """
+        Save inventory to JSON file atomically and durably, UTF-8 encoded.
+        """
+        path = Path(file)
+        tmp, exact = _write_tmp(path, self._data)
+        tmp.replace(path)
+        _fsync_dir(path.parent)
+        key = path.resolve()
+        if exact:
+            _saved_files[key] = _signature(path.stat())
+        else:
+            # Needs the validating load path to be read back exactly
+            _saved_files.pop(key, None)
+
+    def print_data(self) -> None:
+        """Print a human-readable report of all items in a single write."""
+        lines = ["Items Report"]
+        data = self._data
+        lines.extend(f"{name} -> {qty}" for name, qty in data.items())
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+
+
+# Module-level API: bound methods of one instance wrapping stock_data, so
+# every module function shares a single dict without an extra call frame.
+# Mutate stock_data in place (e.g. stock_data.clear()); rebinding the name
+# does not change the dict these functions use.
+_inventory = Inventory(stock_data)
+add_item = _inventory.add_item
+add_items_bulk = _inventory.add_items_bulk
+make_adder = _inventory.make_adder
+remove_item = _inventory.remove_item
+get_qty = _inventory.get_qty
+check_low_items = _inventory.check_low_items
+load_data = _inventory.load_data
+save_data = _inventory.save_data
+print_data = _inventory.print_data
+
+
+def format_log(rec: LogRecord) -> str:
+    """Render one log record as a local-time "Added" line."""
+    ts, item, qty = rec
+    seconds, nanos = divmod(ts, 1_000_000_000)
+    stamp = datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000)
+    return f"{stamp}: Added {qty} of {item}"
+
+
+def flush_logs(logs: List[LogRecord]) -> List[str]:
     """
-    Return list of item names whose quantities are below threshold.
+    Format buffered log records into lines and empty the buffer.
     """
-    if not isinstance(threshold, int) or threshold < 0:
-        raise ValueError("threshold must be a non-negative integer")
-    result: List[str] = []
-    for name, qty in stock_data.items():
-        if qty < threshold:
-            result.append(name)
-    return result
+    lines = [format_log(rec) for rec in logs]
+    logs.clear()
+    return lines
+
+
+def save_batch(snapshots: Iterable[Tuple[str, Dict[str, int]]]) -> None:
+    """
+    Save several (file, data) snapshots atomically and durably.
+    All renames happen after every temp file is synced, and each
+    directory is synced once. A repeated file, including aliases of the
+    same path, keeps its last snapshot. On failure, leftover temp files
+    are removed.
+    """
+    # Dedupe on the resolved path, but write the path as given so that
+    # symlinks are replaced exactly as save_data replaces them
+    latest: Dict[Path, Tuple[Path, Dict[str, int]]] = {}
+    for file, data in snapshots:
+        path = Path(file)
+        latest[path.resolve()] = (path, data)
+    if any(_tmp_path(path).resolve() in latest for path, _ in latest.values()):
+        raise ValueError("save_batch target collides with a temp file")
+    pending: List[Tuple[Path, Path]] = []
+    renamed: List[Path] = []
+    try:
+        for path, data in latest.values():
+            pending.append((_write_tmp(path, data)[0], path))
+        for tmp, path in pending:
+            tmp.replace(path)
+            renamed.append(path)
+    except BaseException:
+        for tmp, _ in pending:
+            tmp.unlink(missing_ok=True)
+        # Persist renames that took effect without masking the error
+        for directory in {path.parent for path in renamed}:
+            with contextlib.suppress(OSError):
+                _fsync_dir(directory)
+        raise
+    for directory in {path.parent for path in renamed}:
+        _fsync_dir(directory)
 
 
 def demo() -> None:
@@ -129,7 +408,8 @@ def demo() -> None:
         pass
     try:
         add_item(123, 10)  # type: ignore[arg-type]
-    except ValueError:
+    except (TypeError, ValueError):
+        # mypyc builds reject the non-str at the call with TypeError
         pass
     remove_item("apple", 3)
     remove_item("orange", 1)
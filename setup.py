@@ -0,0 +1,19 @@
+"""
+Build script; compiles inventory.py with mypyc when it is installed.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["inventory.py"])
+
+setup(
+    name="inventory",
+    version="0.1.0",
+    py_modules=["inventory"],
+    ext_modules=ext_modules,
+)